@@ -3,18 +3,17 @@
 from __future__ import annotations
 
 import logging
-import queue
+import selectors
 import socket
 import time
 import enum
 import threading
-import select
 from collections import deque
 from typing import Any, Optional, Sequence
 
 from spacepackets.ccsds.spacepacket import (
     PacketId,
-    parse_space_packets_from_deque,
+    parse_space_packets,
 )
 
 from tmtccmd.com import ComInterface, SendError
@@ -25,6 +24,12 @@ _LOGGER = logging.getLogger(__name__)
 TCP_RECV_WIRETAPPING_ENABLED = False
 TCP_SEND_WIRETAPPING_ENABLED = False
 
+# Reads are coalesced into one TM chunk until it reaches this multiple of the maximum receive
+# size.
+_MAX_COALESCED_CHUNK_FACTOR = 4
+# Only every n-th overwrite of old TM because of a full TM queue is logged.
+_TM_OVERWRITE_LOG_INTERVAL = 100
+
 
 class TcpCommunicationType(enum.Enum):
     """Parse for space packets in the TCP stream, using the space packet header."""
@@ -44,6 +49,7 @@ class TcpSpacepacketsClient(ComInterface):
         inner_thread_delay: float,
         target_address: EthAddr,
         max_packets_stored: Optional[int] = None,
+        max_recv_size: int = 4096,
     ):
         """Initialize a communication interface to send and receive TMTC via TCP.
 
@@ -51,6 +57,13 @@ class TcpSpacepacketsClient(ComInterface):
         :param space_packet_ids: Valid packet IDs for CCSDS space packets. Those will be used
             to parse for space packets inside the TCP stream.
         :param inner_thread_delay: Polling frequency of TCP thread in seconds.
+        :param target_address: Address of the TCP server to connect to.
+        :param max_packets_stored: Maximum number of received TM chunks which are stored until
+            they are retrieved with :py:meth:`receive`. Consecutive socket reads are coalesced,
+            so one chunk can contain multiple packets and up to four times ``max_recv_size``
+            bytes. The oldest chunk is dropped if the queue is full. No limit by default.
+        :param max_recv_size: Maximum number of bytes read from the socket with one receive
+            call.
         """
         self.com_if_id = com_if_id
         self.com_type = TcpCommunicationType.SPACE_PACKETS
@@ -58,16 +71,31 @@ class TcpSpacepacketsClient(ComInterface):
         self.__inner_thread_delay = inner_thread_delay
         self.target_address = target_address
         self.max_packets_stored = max_packets_stored
+        self.max_recv_size = max_recv_size
+        # Re-used for all socket reads, only the received portion is copied out.
+        self.__recv_buf = bytearray(max_recv_size)
+        self.__recv_view = memoryview(self.__recv_buf)
         self.__conn_lock = threading.Lock()
         self.__connected = False
         self.__tcp_socket = None
         self.__thread_kill_signal = threading.Event()
         # Separate thread to request TM packets periodically if no TCs are being sent
         self.__tcp_thread = None
-        self.__tm_queue = queue.Queue()
-        self.__tc_queue = queue.Queue()
-        self.__analysis_queue = deque()
+        # Each queue has exactly one producer and one consumer thread. Appending and popping on
+        # opposite ends of a deque is thread-safe, so no additional locking is required.
+        # Old TM is discarded automatically if the maximum number of stored packets is reached.
+        self.__tm_queue = deque(maxlen=max_packets_stored)
+        self.__tc_queue = deque()
+        self.__tm_overwrite_count = 0
+        # Received stream data which was not parsed into packets yet.
+        self.__analysis_buf = bytearray()
         self._tm_packet_list = []
+        # The communication type does not change, so the TM parser is only selected once. The
+        # plain function is stored to avoid a reference cycle through a bound method.
+        if self.com_type == TcpCommunicationType.SPACE_PACKETS:
+            self.__parse_tm = TcpSpacepacketsClient.__parse_space_packets
+        else:
+            self.__parse_tm = TcpSpacepacketsClient.__pass_raw_tm
 
     @property
     def id(self) -> str:
@@ -105,6 +133,17 @@ class TcpSpacepacketsClient(ComInterface):
     def __init_socket(self):
         if self.__tcp_socket is None:
             self.__tcp_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # TCs are usually small packets, do not delay them with Nagle's algorithm.
+            self.__tcp_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self.max_packets_stored is not None:
+                # Make sure the kernel can buffer as much TM as the TM queue can store, taking
+                # the coalesced chunk size into account. This needs to be set before connecting
+                # so it is taken into account for the TCP window.
+                rcvbuf_size = (
+                    self.max_recv_size * _MAX_COALESCED_CHUNK_FACTOR * self.max_packets_stored
+                )
+                if rcvbuf_size > self.__tcp_socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF):
+                    self.__tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf_size)
             self.__tcp_socket.settimeout(2.0)
 
     def __connect_socket(self):
@@ -119,17 +158,18 @@ class TcpSpacepacketsClient(ComInterface):
             self.__tcp_socket.settimeout(None)
 
     def close(self, args: Any = None) -> None:
-        if not self.is_open():
-            return
+        # Always signal the TCP thread, the connection might already have been shut down while
+        # the thread is still running.
         self.__thread_kill_signal.set()
-        if self.__tcp_thread is not None:
+        # The finalizer can run on the TCP thread if it held the last reference to the client.
+        if self.__tcp_thread is not None and self.__tcp_thread is not threading.current_thread():
             self.__tcp_thread.join(self.__inner_thread_delay)
             with self.__conn_lock:
                 self.__connected = False
         self.__tcp_socket = None
 
     def send(self, data: bytes | bytearray):
-        self.__tc_queue.put(data)
+        self.__tc_queue.append(data)
 
     def receive(self, parameters: float = 0) -> list[bytes]:
         self.__tm_queue_to_packet_list()
@@ -138,30 +178,32 @@ class TcpSpacepacketsClient(ComInterface):
         return tm_packet_list
 
     def __tm_queue_to_packet_list(self):
-        while self.__tm_queue.qsize() > 0:
-            self.__analysis_queue.append(self.__tm_queue.get())
+        if not self.__tm_queue:
+            # Only an incomplete packet can remain from the last call, no need to scan it again.
+            return
+        # The TCP thread keeps appending while this runs. Popping one chunk at a time is the only
+        # lock-free transfer which can not lose data, unlike swapping or clearing the deque.
+        # Bursts are already coalesced into few large chunks by the TCP thread.
+        while self.__tm_queue:
+            self.__analysis_buf.extend(self.__tm_queue.popleft())
+        self.__parse_tm(self)
+
+    def __parse_space_packets(self):
         # TCP is stream based, so there might be broken packets or multiple packets in one recv
         # call. We parse the space packets contained in the stream here
-        if self.com_type == TcpCommunicationType.SPACE_PACKETS and self.__analysis_queue:
-            result = parse_space_packets_from_deque(
-                analysis_queue=self.__analysis_queue,
-                packet_ids=self.space_packet_ids,
-            )
-            for packet in result.tm_list:
-                self._tm_packet_list.append(packet)
-            flattened = bytearray()
-            while self.__analysis_queue:
-                flattened.extend(self.__analysis_queue.popleft())
-            # Might be spammy, but I consider this a configuration error, and the user
-            # should be notified about it.
-            for skipped_range in result.skipped_ranges:
-                _LOGGER.warning("skipped bytes in received TCP datastream:")
-                print(flattened[skipped_range.start : skipped_range.stop])
-                _LOGGER.warning("list of valid packet IDs might be incomplete")
-            self.__analysis_queue.append(flattened[result.scanned_bytes :])
-        else:
-            while self.__analysis_queue:
-                self._tm_packet_list.append(self.__analysis_queue.popleft())
+        result = parse_space_packets(buf=self.__analysis_buf, packet_ids=self.space_packet_ids)
+        self._tm_packet_list.extend(result.tm_list)
+        # Might be spammy, but I consider this a configuration error, and the user
+        # should be notified about it.
+        for skipped_range in result.skipped_ranges:
+            _LOGGER.warning("skipped bytes in received TCP datastream:")
+            print(self.__analysis_buf[skipped_range.start : skipped_range.stop])
+            _LOGGER.warning("list of valid packet IDs might be incomplete")
+        del self.__analysis_buf[: result.scanned_bytes]
+
+    def __pass_raw_tm(self):
+        self._tm_packet_list.append(bytes(self.__analysis_buf))
+        self.__analysis_buf.clear()
 
     def __tcp_task(self):
         while True and not self.__thread_kill_signal.is_set():
@@ -174,21 +216,27 @@ class TcpSpacepacketsClient(ComInterface):
     def __tmtc_event_loop(self):
         assert self.__tcp_socket is not None
         try:
-            while True:
-                outputs = []
-                queue_size = self.__tc_queue.qsize()
-                if queue_size > 0:
-                    outputs.append(self.__tcp_socket)
-                (readable, writable, _) = select.select(
-                    [self.__tcp_socket], outputs, [], self.__inner_thread_delay
-                )
-                if self.__thread_kill_signal.is_set():
-                    self.__tcp_socket.close()
-                    break
-                if queue_size > 0 and writable and writable[0]:
-                    self.__tc_handling(queue_size)
-                if readable and readable[0]:
-                    self.__tm_handling()
+            with selectors.DefaultSelector() as selector:
+                events = selectors.EVENT_READ
+                selector.register(self.__tcp_socket, events)
+                while True:
+                    # Only wait for the socket to become writable if there are TCs to send.
+                    requested_events = selectors.EVENT_READ
+                    if self.__tc_queue:
+                        requested_events |= selectors.EVENT_WRITE
+                    if requested_events != events:
+                        selector.modify(self.__tcp_socket, requested_events)
+                        events = requested_events
+                    ready = selector.select(self.__inner_thread_delay)
+                    if self.__thread_kill_signal.is_set():
+                        self.__tcp_socket.close()
+                        break
+                    for _, ready_events in ready:
+                        if ready_events & selectors.EVENT_WRITE:
+                            self.__tc_handling()
+                        if ready_events & selectors.EVENT_READ and not self.__tm_handling(selector):
+                            # The connection was shut down, the socket is closed.
+                            return
         except KeyboardInterrupt:
             _LOGGER.info("Keyboard interrupt, shutting down TCP task")
             self.__force_shutdown()
@@ -196,34 +244,66 @@ class TcpSpacepacketsClient(ComInterface):
             self.__force_shutdown()
             _LOGGER.exception("ConnectionResetError. TCP server might not be up")
 
-    def __tc_handling(self, queue_size: int):
+    def __tc_handling(self):
+        data = self.__tc_queue.popleft()
+        if TCP_SEND_WIRETAPPING_ENABLED:
+            _LOGGER.debug("sending TCP packet with length %d: %s", len(data), data.hex(sep=","))
         try:
-            self.__tcp_socket.sendto(self.__tc_queue.get(), self.target_address.to_tuple)
-            queue_size -= 1
+            self.__tcp_socket.sendall(data)
         except BrokenPipeError as e:
             raise SendError(f"{e}", e)
         except ConnectionRefusedError or OSError as e:
             self.__force_shutdown()
             raise SendError(f"TCP connection attempt failed with exception: {e}", e)
 
-    def __tm_handling(self):
-        bytes_recvd = self.__tcp_socket.recv(4096)
-        if bytes_recvd == b"":
-            self.__force_shutdown()
-            _LOGGER.info("TCP server has been closed")
-            return
-        if (
-            self.max_packets_stored is not None
-            and self.__tm_queue.qsize() >= self.max_packets_stored
-        ):
-            _LOGGER.warning(
-                "Number of packets in TCP queue too large. " "Overwriting old packets.."
+    def __tm_handling(self, selector: selectors.BaseSelector) -> bool:
+        """Read the available TM from the socket.
+
+        :return: False if the connection was shut down, True otherwise.
+        """
+        # Coalesce data which is already buffered by the kernel into one chunk, so a burst of TM
+        # is parsed in one go. The size limit ensures that pending TCs are still sent.
+        chunk = bytearray()
+        while len(chunk) < self.max_recv_size * _MAX_COALESCED_CHUNK_FACTOR:
+            read_len = self.__tcp_socket.recv_into(self.__recv_buf, self.max_recv_size)
+            if read_len == 0:
+                if chunk:
+                    self.__store_tm(chunk)
+                self.__force_shutdown()
+                _LOGGER.info("TCP server has been closed")
+                return False
+            chunk.extend(self.__recv_view[:read_len])
+            # Only the TCP socket is registered.
+            ready = selector.select(0)
+            if not ready or not ready[0][1] & selectors.EVENT_READ:
+                break
+        self.__store_tm(chunk)
+        return True
+
+    def __store_tm(self, bytes_recvd: bytes | bytearray):
+        # The consumer can pop TM between the length check and the append without a lock, so this
+        # only detects a likely overwrite. The overwrite count is an upper bound for that reason.
+        overwrite = (
+            self.__tm_queue.maxlen is not None and len(self.__tm_queue) >= self.__tm_queue.maxlen
+        )
+        # Make the TM available to the consumer first, logging might block on the handlers.
+        self.__tm_queue.append(bytes_recvd)
+        if TCP_RECV_WIRETAPPING_ENABLED:
+            _LOGGER.debug(
+                "received TCP data with length %d: %s", len(bytes_recvd), bytes_recvd.hex(sep=",")
             )
-            self.__tm_queue.get()
+        if overwrite:
+            # Only log every so often, this would otherwise be spammy under sustained overload.
+            if self.__tm_overwrite_count % _TM_OVERWRITE_LOG_INTERVAL == 0:
+                _LOGGER.warning(
+                    "Number of packets in TCP queue too large. Overwriting old packets.. "
+                    "(up to %d overwritten so far)",
+                    self.__tm_overwrite_count + 1,
+                )
+            self.__tm_overwrite_count += 1
             # TODO: If segments are received but the receiver is unable to parse packets
             #       properly, it might make sense to have a timeout which then also
             #       logs that there might be an issue reading packets
-        self.__tm_queue.put(bytes(bytes_recvd))
 
     def data_available(self, timeout: float = 0, parameters: Any = 0) -> int:
         self.__tm_queue_to_packet_list()
@@ -231,6 +311,8 @@ class TcpSpacepacketsClient(ComInterface):
 
     def __force_shutdown(self):
         assert self.__tcp_socket is not None
+        # There is nothing left to do for the TCP thread without a connection.
+        self.__thread_kill_signal.set()
         self.__tcp_socket.close()
         with self.__conn_lock:
             self.__connected = False
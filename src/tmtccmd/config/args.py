@@ -414,19 +414,18 @@ def args_to_params_generic(
 def cfdp_args_to_cfdp_params(pargs: argparse.Namespace, cfdp_params: CfdpParams):
     """Convert the argument parser CFDP arguments provided by this library to the internalized
     :py:class:`tmtccmd.config.defs.CfdpParams` dataclass."""
-    if hasattr(pargs, "source"):
-        cfdp_params.source_file = pargs.source
-    if hasattr(pargs, "target"):
-        cfdp_params.dest_file = pargs.target
-    if hasattr(pargs, "no_closure"):
-        cfdp_params.closure_requested = not pargs.no_closure
-    if hasattr(pargs, "type"):
-        if pargs.type in ["0", "nak"]:
-            cfdp_params.transmission_mode = TransmissionMode.UNACKNOWLEDGED
-        elif pargs.type in ["1", "ack"]:
-            cfdp_params.transmission_mode = TransmissionMode.ACKNOWLEDGED
-    if hasattr(pargs, "proxy"):
-        cfdp_params.proxy_op = pargs.proxy
+    # Missing arguments keep the current parameter values.
+    cfdp_params.source_file = getattr(pargs, "source", cfdp_params.source_file)
+    cfdp_params.dest_file = getattr(pargs, "target", cfdp_params.dest_file)
+    cfdp_params.closure_requested = not getattr(
+        pargs, "no_closure", not cfdp_params.closure_requested
+    )
+    transmission_type = getattr(pargs, "type", None)
+    if transmission_type in ["0", "nak"]:
+        cfdp_params.transmission_mode = TransmissionMode.UNACKNOWLEDGED
+    elif transmission_type in ["1", "ack"]:
+        cfdp_params.transmission_mode = TransmissionMode.ACKNOWLEDGED
+    cfdp_params.proxy_op = getattr(pargs, "proxy", cfdp_params.proxy_op)
 
 
 def args_to_all_params_for_cfdp(
@@ -713,17 +712,16 @@ class PostArgsParsingWrapper:
         return self.args_raw.gui
 
     def request_type_from_args(self) -> TcProcedureType:
-        if hasattr(self.args_raw, "proc_type"):
-            if self.args_raw.proc_type == "tmtc":
-                return TcProcedureType.TREE_COMMANDING
-            elif self.args_raw.proc_type == "cfdp":
-                return TcProcedureType.CFDP
-            else:
-                raise ValueError(
-                    'Procedure type argument destination unknown, should be "tmtc" or' ' "cfdp"'
-                )
-        else:
+        # Tree commanding is the default if the parser does not have procedure subcommands.
+        proc_type = getattr(self.args_raw, "proc_type", "tmtc")
+        if proc_type == "tmtc":
             return TcProcedureType.TREE_COMMANDING
+        elif proc_type == "cfdp":
+            return TcProcedureType.CFDP
+        else:
+            raise ValueError(
+                'Procedure type argument destination unknown, should be "tmtc" or' ' "cfdp"'
+            )
 
     def set_params_with_prompts(self, proc_base: ProcedureParamsWrapper):
         self._set_params(proc_base, True)
@@ -2,7 +2,7 @@ import enum
 import pprint
 
 from deprecated.sphinx import deprecated
-from tmtccmd.core.globals_manager import update_global
+from tmtccmd.core.globals_manager import get_global, update_global
 from tmtccmd.config.defs import (
     CoreModeList,
     CoreComInterfaces,
@@ -73,8 +73,8 @@ def set_default_globals_pre_args_parsing(
     update_global(CoreGlobalIds.CURRENT_SERVICE, 17)
     update_global(CoreGlobalIds.SERIAL_CONFIG, dict())
     update_global(CoreGlobalIds.ETHERNET_CONFIG, dict())
-    pp = pprint.PrettyPrinter()
-    update_global(CoreGlobalIds.PRETTY_PRINTER, pp)
+    # Created on first use by get_pretty_printer
+    update_global(CoreGlobalIds.PRETTY_PRINTER, None)
     update_global(CoreGlobalIds.TM_LISTENER_HANDLE, None)
     update_global(CoreGlobalIds.COM_INTERFACE_HANDLE, None)
     update_global(CoreGlobalIds.TMTC_PRINTER_HANDLE, None)
@@ -85,6 +85,14 @@ def set_default_globals_pre_args_parsing(
     update_global(CoreGlobalIds.MODE, CoreModeList.LISTENER_MODE)
 
 
+def get_pretty_printer() -> pprint.PrettyPrinter:
+    pp = get_global(CoreGlobalIds.PRETTY_PRINTER)
+    if pp is None:
+        pp = pprint.PrettyPrinter()
+        update_global(CoreGlobalIds.PRETTY_PRINTER, pp)
+    return pp
+
+
 @deprecated(version="6.0.0rc0", reason="globals module deprecated")
 def check_and_set_other_args(args):
     if args.listener is not None:
@@ -10,9 +10,12 @@ from spacepackets import SpacePacketHeader
 from spacepackets.ccsds.spacepacket import PacketId, PacketSeqCtrl
 from spacepackets.ecss.defs import PusService
 from spacepackets.ecss.pus_5_event import Subservice
-from spacepackets.ecss.tm import CdsShortTimestamp, AbstractPusTm, PusTelemetry
+from spacepackets.ecss.tm import AbstractPusTm, PusTelemetry
 from tmtccmd.pus.s5_fsfw_event_defs import Severity
 
+# Event ID, reporter ID, parameter 1, parameter 2
+_EVENT_STRUCT = struct.Struct("!H4sII")
+
 
 @dataclasses.dataclass
 class EventDefinition:
@@ -22,12 +25,12 @@ class EventDefinition:
     param2: int
 
     def pack(self) -> bytes:
-        raw = bytearray(struct.pack("!H", self.event_id))
-        if len(self.reporter_id) < 4:
-            raise ValueError("reporter ID must be at least 4 bytes wide")
-        raw.extend(self.reporter_id)
-        raw.extend(struct.pack("!I", self.param1))
-        raw.extend(struct.pack("!I", self.param2))
+        if len(self.reporter_id) != 4:
+            raise ValueError("reporter ID must be exactly 4 bytes wide")
+        raw = bytearray(_EVENT_STRUCT.size)
+        _EVENT_STRUCT.pack_into(
+            raw, 0, self.event_id, bytes(self.reporter_id), self.param1, self.param2
+        )
         return raw
 
     @classmethod
@@ -38,11 +41,7 @@ class EventDefinition:
     def from_bytes(cls, data: bytes) -> EventDefinition:
         if len(data) < 14:
             raise ValueError("full FSFW event definition must be at least 14 bytes wide")
-        event_id = struct.unpack("!H", data[0:2])[0]
-        object_id = bytes(data[2:6])
-        param1 = struct.unpack("!I", data[6:10])[0]
-        param2 = struct.unpack("!I", data[10:14])[0]
-        return cls(event_id, object_id, param1, param2)
+        return cls(*_EVENT_STRUCT.unpack_from(data, 0))
 
 
 class Service5Tm(AbstractPusTm):
@@ -108,26 +107,16 @@ class Service5Tm(AbstractPusTm):
     def source_data(self) -> bytes:
         return self.pus_tm.source_data
 
-    @classmethod
-    def __empty(cls) -> Service5Tm:
-        return cls(
-            apid=0x0,
-            subservice=Subservice.TM_INFO_EVENT,
-            event=EventDefinition.empty(),
-            timestamp=CdsShortTimestamp.empty().pack(),
-        )
-
     @classmethod
     def from_tm(cls, pus_tm: PusTelemetry) -> Service5Tm:
-        instance = cls.__empty()
+        # Bypass the constructor, which would build a throwaway telemetry packet first.
+        instance = cls.__new__(cls)
         instance.pus_tm = pus_tm
         return instance
 
     @classmethod
     def unpack(cls, data: bytes, timestamp_len: int) -> Service5Tm:
-        instance = cls.__empty()
-        instance.pus_tm = PusTelemetry.unpack(data=data, timestamp_len=timestamp_len)
-        return instance
+        return cls.from_tm(PusTelemetry.unpack(data=data, timestamp_len=timestamp_len))
 
     @property
     def severity(self) -> Severity:
@@ -1,4 +1,6 @@
 import collections.abc
+import enum
+import functools
 import logging
 from typing import Any, Tuple, Union
 from contextlib import contextmanager
@@ -67,13 +69,10 @@ def __handle_iterable_non_dict(
     might_be_integer: bool,
     init_res_tuple: Tuple[bool, Any],
 ) -> Tuple[bool, Any]:
-    param_list = list()
-    for idx, enum_value in enumerate(iterable):
-        if isinstance(enum_value.value, str):
-            # Make this case insensitive
-            param_list.append(enum_value.value.lower())
-        else:
-            param_list.append(enum_value.value)
+    if isinstance(iterable, enum.EnumMeta):
+        param_list = __enum_value_set(iterable)
+    else:
+        param_list = __build_value_set(iterable)
     if param not in param_list:
         if might_be_integer:
             if int(param) in param_list:
@@ -82,6 +81,29 @@ def __handle_iterable_non_dict(
     return init_res_tuple
 
 
+def __build_value_set(
+    iterable: collections.abc.Iterable,
+) -> Union[frozenset, Tuple[Any, ...]]:
+    values = []
+    for enum_value in iterable:
+        if isinstance(enum_value.value, str):
+            # Make this case insensitive
+            values.append(enum_value.value.lower())
+        else:
+            values.append(enum_value.value)
+    try:
+        return frozenset(values)
+    except TypeError:
+        # Unhashable values, fall back to a linear search.
+        return tuple(values)
+
+
+@functools.lru_cache(maxsize=None)
+def __enum_value_set(enumeration: enum.EnumMeta) -> Union[frozenset, Tuple[Any, ...]]:
+    # Enumeration members are fixed, so the value set only needs to be built once per class.
+    return __build_value_set(enumeration)
+
+
 @contextmanager
 def acquire_timeout(lock, timeout):
     """Helper functions which allows to check result of the acquire operation while also
@@ -91,6 +113,8 @@ def acquire_timeout(lock, timeout):
     :return:
     """
     result = lock.acquire(timeout=timeout)
-    yield result
-    if result:
-        lock.release()
+    try:
+        yield result
+    finally:
+        if result:
+            lock.release()
@@ -50,8 +50,46 @@ class TestTcpIf(TestCase):
         self._test_send()
         self._test_recv()
         self._test_recv_with_invalid_packet()
+        self._test_recv_split_packet()
         self._test_close_client()
 
+    def test_server_closes_connection(self):
+        self._open()
+        (conn_sock, _) = self.tcp_server.accept()
+        conn_sock.close()
+        time.sleep(0.2)
+        self.assertFalse(self.tcp_client.is_open())
+        # Closing the client also has to work if the server already closed the connection.
+        self.tcp_client.close()
+        self.assertFalse(self.tcp_client.is_open())
+
+    def test_tm_queue_overwrite(self):
+        self.tcp_client = TcpSpacepacketsClient(
+            "tcp",
+            space_packet_ids=[self.expected_packet_id],
+            target_address=EthAddr.from_tuple(self.addr),
+            inner_thread_delay=0.05,
+            max_packets_stored=2,
+        )
+        self.tcp_client.initialize()
+        self._open()
+        tcp_server = threading.Thread(target=self.tcp_echo_server_thread, daemon=True)
+        tcp_server.start()
+        replies = [
+            PusTelemetry(service=17, subservice=2, apid=0x22, seq_count=i, timestamp=bytes())
+            for i in range(3)
+        ]
+        with self.assertLogs("tmtccmd.com.tcp", level="WARNING") as logs:
+            for reply in replies:
+                # Wait for each echo so every reply is stored as a separate TM chunk.
+                self.tcp_client.send(reply.pack())
+                time.sleep(0.15)
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("Overwriting old packets", logs.records[0].getMessage())
+        # The oldest reply is dropped.
+        recvd_packets = self.tcp_client.receive()
+        self.assertEqual(recvd_packets, [reply.pack() for reply in replies[1:]])
+
     def tcp_echo_server_thread(self):
         (conn_sock, addr_info) = self.tcp_server.accept()
         while True:
@@ -101,12 +139,12 @@ class TestTcpIf(TestCase):
         self.tcp_client.send(self.ping_cmd.pack())
         self.tcp_client.send(self.ping_reply.pack())
         time.sleep(0.2)
-        # Assert both packets arrived at the server
-        self.assertEqual(len(self.server_received_packets), 2)
-        packet_0 = self.server_received_packets.pop()
-        self.assertEqual(packet_0, self.ping_cmd.pack())
-        packet_1 = self.server_received_packets.pop()
-        self.assertEqual(packet_1, self.ping_reply.pack())
+        # Assert both packets arrived at the server. TCP is stream based, so both packets might
+        # have been read by the server at once.
+        server_stream = bytearray()
+        while self.server_received_packets:
+            server_stream.extend(self.server_received_packets.pop())
+        self.assertEqual(server_stream, self.ping_cmd.pack() + self.ping_reply.pack())
 
         # Now assert that a ping reply was sent back to the client if a ping command was sent
         self.assertEqual(self.tcp_client.data_available(), 1)
@@ -114,6 +152,20 @@ class TestTcpIf(TestCase):
         self.assertEqual(len(recvd_packets), 1)
         self.assertEqual(recvd_packets[0], self.ping_reply.pack())
 
+    def _test_recv_split_packet(self):
+        raw_reply = self.ping_reply.pack()
+        self.tcp_client.send(raw_reply[:4])
+        time.sleep(0.2)
+        # Incomplete packets are kept until the rest of the packet arrives.
+        self.assertEqual(self.tcp_client.data_available(), 0)
+        self.tcp_client.send(raw_reply[4:])
+        time.sleep(0.2)
+        self.server_received_packets.clear()
+        self.assertEqual(self.tcp_client.data_available(), 1)
+        recvd_packets = self.tcp_client.receive()
+        self.assertEqual(len(recvd_packets), 1)
+        self.assertEqual(recvd_packets[0], raw_reply)
+
     def _open(self):
         self.tcp_client.open()
         self.assertTrue(self.tcp_client.is_open())
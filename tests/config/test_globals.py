@@ -0,0 +1,24 @@
+import pprint
+import warnings
+from unittest import TestCase
+
+from tmtccmd.config.globals import (
+    CoreGlobalIds,
+    get_pretty_printer,
+    set_default_globals_pre_args_parsing,
+)
+from tmtccmd.core.globals_manager import get_global
+
+
+class TestGlobals(TestCase):
+    def test_pretty_printer_created_on_first_use(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            set_default_globals_pre_args_parsing(apid=0x02)
+        self.assertIsNone(get_global(CoreGlobalIds.PRETTY_PRINTER))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            pp = get_pretty_printer()
+        self.assertIsInstance(pp, pprint.PrettyPrinter)
+        self.assertIs(get_pretty_printer(), pp)
+        self.assertIs(get_global(CoreGlobalIds.PRETTY_PRINTER), pp)
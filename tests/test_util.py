@@ -1,5 +1,8 @@
+import enum
 from unittest import TestCase
 
+from tmtccmd.util.conf_util import check_args_in_dict
+
 from tmtccmd.util.obj_id import (
     ComponentIdU16,
     ComponentIdU32,
@@ -47,3 +50,51 @@ class TestObjectId(TestCase):
         self.assertEqual(obj_id_u16_from_raw, obj_id_u16)
         obj_id_u32_from_raw = ComponentIdU32.from_bytes(obj_id_u32.as_bytes)
         self.assertEqual(obj_id_u32_from_raw, obj_id_u32)
+
+
+class StrEnumExample(enum.Enum):
+    FOO = "Foo"
+    BAR = "bar"
+
+
+class IntEnumExample(enum.IntEnum):
+    ONE = 1
+    TWO = 2
+
+
+class UnhashableEnumExample(enum.Enum):
+    LIST = [1, 2]
+    FOO = "foo"
+    TWO = 2
+
+
+class TestCheckArgs(TestCase):
+    # Known issue of the non-dict path: parameters which are found without the digit string
+    # conversion, for example "bar" for StrEnumExample or 2 for IntEnumExample, yield (False, 0).
+    # Those cases are not covered here, only absent values and digit string matches.
+    def test_digit_string_in_int_enum(self):
+        self.assertEqual(check_args_in_dict("2", IntEnumExample, "test"), (True, 2))
+        # Cached value set for the enumeration is re-used.
+        self.assertEqual(check_args_in_dict("2", IntEnumExample, "test"), (True, 2))
+
+    def test_digit_string_not_in_int_enum(self):
+        self.assertEqual(check_args_in_dict("3", IntEnumExample, "test"), (False, 0))
+
+    def test_unknown_str_in_enum(self):
+        self.assertEqual(check_args_in_dict("baz", StrEnumExample, "test"), (False, 0))
+        self.assertEqual(check_args_in_dict("1", StrEnumExample, "test"), (False, 0))
+
+    def test_enum_with_unhashable_values(self):
+        self.assertEqual(check_args_in_dict("baz", UnhashableEnumExample, "test"), (False, 0))
+        self.assertEqual(check_args_in_dict("3", UnhashableEnumExample, "test"), (False, 0))
+        self.assertEqual(check_args_in_dict("2", UnhashableEnumExample, "test"), (True, 2))
+
+    def test_non_enum_iterable(self):
+        self.assertEqual(check_args_in_dict("2", list(IntEnumExample), "test"), (True, 2))
+
+    def test_dict(self):
+        self.assertEqual(check_args_in_dict(5, {1: 5, 2: 6}, "test"), (True, 1))
+
+    def test_invalid_param(self):
+        self.assertEqual(check_args_in_dict(None, IntEnumExample, "test"), (False, 0))
+        self.assertEqual(check_args_in_dict(2.0, IntEnumExample, "test"), (False, 0))
@@ -1,6 +1,6 @@
 import struct
 from unittest import TestCase
-from tmtccmd.pus.s5_fsfw_event import Service5Tm, Subservice, EventDefinition
+from tmtccmd.pus.s5_fsfw_event import Service5Tm, Subservice, EventDefinition, Severity
 
 
 class TestSrv5Tm(TestCase):
@@ -35,3 +35,15 @@ class TestSrv5Tm(TestCase):
         unpacked = Service5Tm.unpack(raw_tm, 0)
         self.assertEqual(self.srv5_tm, unpacked)
         self.assertEqual(unpacked.event_definition, self.event_def)
+
+    def test_from_tm(self):
+        from_tm = Service5Tm.from_tm(self.srv5_tm.pus_tm)
+        self.assertEqual(self.srv5_tm, from_tm)
+        self.assertEqual(from_tm.severity, Severity.INFO)
+        self.assertEqual(from_tm.event_definition, self.event_def)
+
+    def test_invalid_reporter_id_len(self):
+        with self.assertRaises(ValueError):
+            EventDefinition(1, bytes([0x01, 0x02, 0x03]), 2, 3).pack()
+        with self.assertRaises(ValueError):
+            EventDefinition(1, bytes([0x01, 0x02, 0x03, 0x04, 0x05]), 2, 3).pack()